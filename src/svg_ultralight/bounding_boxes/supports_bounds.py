@@ -45,6 +45,8 @@ class SupportsBounds(Protocol):
     set width and height.
     """
 
+    __slots__ = ()
+
     @property
     def transformation(self) -> _Matrix:
         """Return an svg-style transformation matrix."""
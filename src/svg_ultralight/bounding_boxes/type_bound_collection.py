@@ -12,10 +12,21 @@ from typing import TYPE_CHECKING
 from lxml.etree import _Element as EtreeElement  # type: ignore
 
 from svg_ultralight.bounding_boxes.bound_helpers import new_bbox_union
-from svg_ultralight.bounding_boxes.type_bounding_box import HasBoundingBox
-from svg_ultralight.transformations import new_transformation_matrix, transform_element
+from svg_ultralight.bounding_boxes.type_bounding_box import (
+    DeferredTransformation,
+    HasBoundingBox,
+)
+from svg_ultralight.transformations import (
+    IDENTITY_MATRIX,
+    new_transformation_matrix,
+    transform_element,
+)
 
 if TYPE_CHECKING:
+    from types import TracebackType
+
+    from typing_extensions import Self
+
     from svg_ultralight.bounding_boxes.supports_bounds import SupportsBounds
     from svg_ultralight.bounding_boxes.type_bounding_box import BoundingBox
 
@@ -23,7 +34,7 @@ _Matrix = tuple[float, float, float, float, float, float]
 
 
 @dataclasses.dataclass
-class BoundCollection(HasBoundingBox):
+class BoundCollection(DeferredTransformation, HasBoundingBox):
     """A class to hold a list of bound elements and transform them together.
 
     This will transform the individual elements in place.
@@ -37,9 +48,55 @@ class BoundCollection(HasBoundingBox):
 
         :param blems: bound elements to be transformed together
         """
+        DeferredTransformation.__init__(self)
         self.blems = list(blems)
         self.bbox = new_bbox_union(*self.blems)
 
+    def __enter__(self) -> Self:
+        """Defer element writes until the context exits.
+
+        :return: self
+
+        Members that support deferral enter their own context, so every member
+        bbox updates immediately and only element writes wait. Raw elements in
+        self.blems are transformed on exit.
+        """
+        for blem in self.blems:
+            if isinstance(blem, DeferredTransformation):
+                _ = blem.__enter__()
+        return super().__enter__()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Apply deferred transformations to raw elements and members on exit."""
+        super().__exit__(exc_type, exc_value, traceback)
+        for blem in self.blems:
+            if isinstance(blem, DeferredTransformation):
+                blem.__exit__(exc_type, exc_value, traceback)
+
+    def flush(self) -> None:
+        """Apply deferred transformations to raw elements and members.
+
+        :effects: transforms raw elements and flushes members with pending writes
+        """
+        super().flush()
+        for blem in self.blems:
+            if isinstance(blem, DeferredTransformation):
+                blem.flush()
+
+    def _apply_transformation(self, tmat: _Matrix) -> None:
+        """Apply a transformation to each raw element in self.blems.
+
+        :param tmat: the transformation matrix
+        """
+        for blem in self.blems:
+            if isinstance(blem, EtreeElement):
+                _ = transform_element(blem, tmat)
+
     def transform(
         self,
         transformation: _Matrix | None = None,
@@ -63,9 +120,10 @@ class BoundCollection(HasBoundingBox):
         transformation.
         """
         tmat = new_transformation_matrix(transformation, scale=scale, dx=dx, dy=dy)
+        if tmat == IDENTITY_MATRIX:
+            return
         self.bbox.transform(tmat)
         for blem in self.blems:
-            if isinstance(blem, EtreeElement):
-                _ = transform_element(blem, tmat)
-            else:
+            if not isinstance(blem, EtreeElement):
                 blem.transform(tmat)
+        self._apply_or_defer(tmat)
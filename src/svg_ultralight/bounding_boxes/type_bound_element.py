@@ -7,6 +7,11 @@ It is critical to remember that self.elem is a reference. It is not necessary to
 access self.elem through the BoundElement instance. Earlier and later references will
 all be updated as the BoundElement instance is updated.
 
+The exception is a ``with blem:`` block. Inside the block, transformations are
+composed and written to the element only when the block exits or when
+``blem.elem`` is read. Until then, saved references to the element (and any
+ancestor serialized with ``write_svg``) are stale.
+
 :author: Shay Hill
 :created: 2022-12-09
 """
@@ -15,8 +20,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from svg_ultralight.bounding_boxes.type_bounding_box import HasBoundingBox
-from svg_ultralight.transformations import new_transformation_matrix, transform_element
+from svg_ultralight.bounding_boxes.type_bounding_box import (
+    DeferredElement,
+    HasBoundingBox,
+)
+from svg_ultralight.transformations import IDENTITY_MATRIX, new_transformation_matrix
 
 if TYPE_CHECKING:
     from lxml.etree import _Element as EtreeElement  # type: ignore
@@ -26,7 +34,7 @@ if TYPE_CHECKING:
 _Matrix = tuple[float, float, float, float, float, float]
 
 
-class BoundElement(HasBoundingBox):
+class BoundElement(DeferredElement, HasBoundingBox):
     """An element with a bounding box.
 
     Updates the element when x, y, x2, y2, width, or height are set.
@@ -34,17 +42,19 @@ class BoundElement(HasBoundingBox):
     Can access these BoundingBox attributes (plus scale) as attributes of this object.
     """
 
+    __slots__ = ("_defer_depth", "_elem", "_pending_tmat")
+
     def __init__(self, element: EtreeElement, bounding_box: BoundingBox) -> None:
         """Initialize a BoundElement instance.
 
         :param element: the element to be bound
         :param bounding_box: the bounding box around the element
         """
-        self.elem = element
+        DeferredElement.__init__(self, element)
         self.bbox = bounding_box
 
     def _update_elem(self):
-        self.elem.attrib["transform"] = self.bbox.transform_string
+        self.elem.set("transform", self.bbox.transform_string)
 
     def transform(
         self,
@@ -62,5 +72,7 @@ class BoundElement(HasBoundingBox):
         :param dy: the y translation
         """
         tmat = new_transformation_matrix(transformation, scale=scale, dx=dx, dy=dy)
+        if tmat == IDENTITY_MATRIX:
+            return
         self.bbox.transform(tmat)
-        _ = transform_element(self.elem, tmat)
+        self._apply_or_defer(tmat)
@@ -7,13 +7,43 @@
 from __future__ import annotations
 
 import dataclasses
+import operator
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 from svg_ultralight.bounding_boxes.supports_bounds import SupportsBounds
-from svg_ultralight.string_conversion import format_number
-from svg_ultralight.transformations import mat_apply, mat_dot, new_transformation_matrix
+from svg_ultralight.transformations import (
+    IDENTITY_MATRIX,
+    format_matrix,
+    mat_dot,
+    new_transformation_matrix,
+    transform_element,
+)
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from lxml.etree import _Element as EtreeElement  # type: ignore
+    from typing_extensions import Self
 
 _Matrix = tuple[float, float, float, float, float, float]
 
+_get_bounds = operator.attrgetter("x", "y", "width", "height")
+
+
+def _scale_about_xy(bounds: SupportsBounds, scale: float) -> None:
+    """Scale with a single transformation, preserving x and y.
+
+    :param bounds: the object to scale
+    :param scale: the scale factor
+    :effects: transforms bounds unless scale is 1
+    """
+    if scale == 1:
+        return
+    x = bounds.x
+    y = bounds.y
+    bounds.transform((scale, 0, 0, scale, x - x * scale, y - y * scale))
+
 
 @dataclasses.dataclass
 class BoundingBox(SupportsBounds):
@@ -79,7 +109,16 @@ class BoundingBox(SupportsBounds):
     _y: float
     _width: float
     _height: float
-    _transformation: _Matrix = (1, 0, 0, 1, 0, 0)
+    _transformation: _Matrix = IDENTITY_MATRIX
+
+    def __post_init__(self) -> None:
+        """Store the transformation as a tuple.
+
+        format_matrix is cached, so transform_string needs a hashable matrix even
+        if a list was passed as _transformation.
+        """
+        aa, bb, cc, dd, ee, ff = self._transformation
+        self._transformation = (aa, bb, cc, dd, ee, ff)
 
     @property
     def transformation(self) -> _Matrix:
@@ -110,7 +149,15 @@ class BoundingBox(SupportsBounds):
         to be passed in a variety of ways. Scale, dx, and dy are the sensible values
         to pass "by hand". The transformation matrix is the sensible argument to pass
         when applying a transformation from another bounding box instance.
+
+        Translation alone (the common case when aligning and stacking) only changes
+        the last two values of the transformation matrix, so it skips the matrix
+        product.
         """
+        if transformation is None and scale is None:
+            aa, bb, cc, dd, ee, ff = self._transformation
+            self._transformation = (aa, bb, cc, dd, ee + (dx or 0), ff + (dy or 0))
+            return
         tmat = new_transformation_matrix(transformation, scale=scale, dx=dx, dy=dy)
         self._transformation = mat_dot(tmat, self.transformation)
 
@@ -127,7 +174,7 @@ class BoundingBox(SupportsBounds):
         width*scale, height => height*scale, scale => scale*scale. This matches how
         scale works in almost every other context.
         """
-        return self.transformation[0]
+        return self._transformation[0]
 
     @scale.setter
     def scale(self, value: float) -> None:
@@ -142,7 +189,9 @@ class BoundingBox(SupportsBounds):
         `scale = 2` -> ignore whatever scale was previously defined and set scale to 2
         `scale *= 2` -> make it twice as big as it was.
         """
-        self.transform(scale=value / self.scale)
+        ratio = value / self.scale
+        if ratio != 1:
+            self.transform(scale=ratio)
 
     @property
     def x(self) -> float:
@@ -150,7 +199,7 @@ class BoundingBox(SupportsBounds):
 
         :return: internal _x value transformed by scale and translation
         """
-        return mat_apply(self.transformation, (self._x, 0))[0]
+        return self._transformation[0] * self._x + self._transformation[4]
 
     @x.setter
     def x(self, value: float) -> None:
@@ -166,7 +215,8 @@ class BoundingBox(SupportsBounds):
 
         :return: midpoint of transformed x and x2
         """
-        return self.x + self.width / 2
+        tmat = self._transformation
+        return tmat[0] * self._x + tmat[4] + self._width * tmat[0] / 2
 
     @cx.setter
     def cx(self, value: float):
@@ -174,7 +224,7 @@ class BoundingBox(SupportsBounds):
 
         :param value: new center x value after transformation
         """
-        self.x += value - self.cx
+        self.transform(dx=value - self.cx)
 
     @property
     def x2(self) -> float:
@@ -182,7 +232,8 @@ class BoundingBox(SupportsBounds):
 
         :return: transformed x + transformed width
         """
-        return self.x + self.width
+        tmat = self._transformation
+        return tmat[0] * self._x + tmat[4] + self._width * tmat[0]
 
     @x2.setter
     def x2(self, value: float) -> None:
@@ -190,7 +241,7 @@ class BoundingBox(SupportsBounds):
 
         :param value: new x2 value after transformation
         """
-        self.x += value - self.x2
+        self.transform(dx=value - self.x2)
 
     @property
     def y(self) -> float:
@@ -198,7 +249,7 @@ class BoundingBox(SupportsBounds):
 
         :return: internal _y value transformed by scale and translation
         """
-        return mat_apply(self.transformation, (0, self._y))[1]
+        return self._transformation[3] * self._y + self._transformation[5]
 
     @y.setter
     def y(self, value: float) -> None:
@@ -214,7 +265,8 @@ class BoundingBox(SupportsBounds):
 
         :return: midpoint of transformed y and y2
         """
-        return self.y + self.height / 2
+        tmat = self._transformation
+        return tmat[3] * self._y + tmat[5] + self._height * tmat[0] / 2
 
     @cy.setter
     def cy(self, value: float):
@@ -222,7 +274,7 @@ class BoundingBox(SupportsBounds):
 
         :param value: new center y value after transformation
         """
-        self.y += value - self.cy
+        self.transform(dy=value - self.cy)
 
     @property
     def y2(self) -> float:
@@ -230,7 +282,8 @@ class BoundingBox(SupportsBounds):
 
         :return: transformed y + transformed height
         """
-        return self.y + self.height
+        tmat = self._transformation
+        return tmat[3] * self._y + tmat[5] + self._height * tmat[0]
 
     @y2.setter
     def y2(self, value: float) -> None:
@@ -238,7 +291,7 @@ class BoundingBox(SupportsBounds):
 
         :param value: new y2 value after transformation
         """
-        self.y += value - self.y2
+        self.transform(dy=value - self.y2)
 
     @property
     def width(self) -> float:
@@ -246,7 +299,7 @@ class BoundingBox(SupportsBounds):
 
         :return: internal _width value transformed by scale
         """
-        return self._width * self.scale
+        return self._width * self._transformation[0]
 
     @width.setter
     def width(self, value: float) -> None:
@@ -257,11 +310,7 @@ class BoundingBox(SupportsBounds):
         Here transformed x and y value will be preserved. That is, the bounding box
         is scaled, but still anchored at (transformed) self.x and self.y
         """
-        current_x = self.x
-        current_y = self.y
-        self.scale *= value / self.width
-        self.x = current_x
-        self.y = current_y
+        _scale_about_xy(self, value / self.width)
 
     @property
     def height(self) -> float:
@@ -269,7 +318,7 @@ class BoundingBox(SupportsBounds):
 
         :return: internal _height value transformed by scale
         """
-        return self._height * self.scale
+        return self._height * self._transformation[0]
 
     @height.setter
     def height(self, value: float) -> None:
@@ -280,7 +329,7 @@ class BoundingBox(SupportsBounds):
         Here transformed x and y value will be preserved. That is, the bounding box
         is scaled, but still anchored at (transformed) self.x and self.y
         """
-        self.width = value * self.width / self.height
+        _scale_about_xy(self, value / self.height)
 
     @property
     def transform_string(self) -> str:
@@ -291,7 +340,7 @@ class BoundingBox(SupportsBounds):
         Use with
         ``update_element(elem, transform=bbox.transform_string)``
         """
-        return f"matrix({' '.join(map(format_number, self.transformation))})"
+        return format_matrix(self._transformation)
 
     def merge(self, *others: BoundingBox) -> BoundingBox:
         """Create a bounding box around all other bounding boxes.
@@ -316,16 +365,151 @@ class BoundingBox(SupportsBounds):
         if not bboxes:
             msg = "At least one bounding box is required"
             raise ValueError(msg)
-        min_x = min(x.x for x in bboxes)
-        max_x = max(x.x + x.width for x in bboxes)
-        min_y = min(x.y for x in bboxes)
-        max_y = max(x.y + x.height for x in bboxes)
+        if len(bboxes) == 1:
+            bbox = bboxes[0]
+            return BoundingBox(bbox.x, bbox.y, bbox.width, bbox.height)
+        xs, ys, widths, heights = zip(*map(_get_bounds, bboxes))
+        min_x = min(xs)
+        max_x = max(map(operator.add, xs, widths))
+        min_y = min(ys)
+        max_y = max(map(operator.add, ys, heights))
         return BoundingBox(min_x, min_y, max_x - min_x, max_y - min_y)
 
 
+class DeferredTransformation(ABC):
+    """A mixin to apply a block of transformations all at once.
+
+    Inside a ``with`` block, bounds update as usual, but transformations passed to
+    ``_apply_or_defer`` are composed and applied once when the outermost block
+    exits (or when ``flush`` is called).
+
+        ```
+        with padded_text:
+            padded_text.padded_width = 100
+            padded_text.x = 0
+            padded_text.y2 = 0
+        ```
+
+    Subclasses call ``DeferredTransformation.__init__`` and implement
+    ``_apply_transformation``.
+
+    The mixin declares empty ``__slots__`` so it can be combined with other
+    slotted bases like HasBoundingBox. A slotted subclass must list
+    ``_defer_depth`` and ``_pending_tmat`` in its own ``__slots__``.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        """Start with no deferred transformation."""
+        self._defer_depth = 0
+        self._pending_tmat: _Matrix | None = None
+
+    def __enter__(self) -> Self:
+        """Defer applying transformations until the context exits.
+
+        :return: self
+        """
+        self._defer_depth += 1
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Apply any deferred transformation when the outermost context exits."""
+        self._defer_depth -= 1
+        if not self._defer_depth:
+            self.flush()
+
+    def flush(self) -> None:
+        """Apply a deferred transformation.
+
+        :effects: applies the pending transformation, if any
+        """
+        if self._pending_tmat is None:
+            return
+        tmat = self._pending_tmat
+        self._pending_tmat = None
+        self._apply_transformation(tmat)
+
+    @abstractmethod
+    def _apply_transformation(self, tmat: _Matrix) -> None:
+        """Apply a transformation to whatever this instance wraps.
+
+        :param tmat: the transformation matrix
+        """
+
+    def _defer_transformation(self, tmat: _Matrix) -> None:
+        """Compose a transformation with any pending transformation.
+
+        :param tmat: the transformation matrix
+        """
+        if self._pending_tmat is None:
+            self._pending_tmat = tmat
+        else:
+            self._pending_tmat = mat_dot(tmat, self._pending_tmat)
+
+    def _apply_or_defer(self, tmat: _Matrix) -> None:
+        """Apply a transformation now or, inside a ``with`` block, on exit.
+
+        :param tmat: the transformation matrix
+        """
+        if self._defer_depth:
+            self._defer_transformation(tmat)
+        else:
+            self._apply_transformation(tmat)
+
+
+class DeferredElement(DeferredTransformation):
+    """A DeferredTransformation mixin for classes that wrap one element.
+
+    Reading ``elem`` applies any pending transformation first. A slotted subclass
+    must also list ``_elem`` in its ``__slots__``.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, elem: EtreeElement) -> None:
+        """Wrap an element.
+
+        :param elem: the element to transform
+        """
+        super().__init__()
+        self._elem = elem
+
+    @property
+    def elem(self) -> EtreeElement:
+        """The element with any deferred transformation applied.
+
+        :return: the element
+        """
+        self.flush()
+        return self._elem
+
+    @elem.setter
+    def elem(self, value: EtreeElement) -> None:
+        """Set the element.
+
+        :param value: the new element
+        """
+        self._elem = value
+
+    def _apply_transformation(self, tmat: _Matrix) -> None:
+        """Transform the element.
+
+        :param tmat: the transformation matrix
+        """
+        _ = transform_element(self._elem, tmat)
+
+
 class HasBoundingBox(SupportsBounds):
     """A parent class for BoundElement and others that have a bbox attribute."""
 
+    __slots__ = ("bbox",)
+
     def __init__(self, bbox: BoundingBox) -> None:
         """Initialize the HasBoundingBox instance."""
         self.bbox = bbox
@@ -366,7 +550,9 @@ class HasBoundingBox(SupportsBounds):
 
         :param value: the scale of the bounding box
         """
-        self.transform(scale=value / self.scale)
+        ratio = value / self.scale
+        if ratio != 1:
+            self.transform(scale=ratio)
 
     @property
     def x(self) -> float:
@@ -398,7 +584,7 @@ class HasBoundingBox(SupportsBounds):
 
         :param value: the new x coordinate of the right edge of the bounding box
         """
-        self.x += value - self.x2
+        self.transform(dx=value - self.x2)
 
     @property
     def cx(self) -> float:
@@ -414,7 +600,7 @@ class HasBoundingBox(SupportsBounds):
 
         :param value: the new x coordinate of the center of the bounding box
         """
-        self.x += value - self.cx
+        self.transform(dx=value - self.cx)
 
     @property
     def y(self) -> float:
@@ -446,7 +632,7 @@ class HasBoundingBox(SupportsBounds):
 
         :param value: the new y coordinate of the bottom edge of the bounding box
         """
-        self.y += value - self.y2
+        self.transform(dy=value - self.y2)
 
     @property
     def cy(self) -> float:
@@ -462,7 +648,7 @@ class HasBoundingBox(SupportsBounds):
 
         :param value: the new y coordinate of the center of the bounding box
         """
-        self.y += value - self.cy
+        self.transform(dy=value - self.cy)
 
     @property
     def width(self) -> float:
@@ -477,12 +663,10 @@ class HasBoundingBox(SupportsBounds):
         """Set the width of the bounding box.
 
         :param value: the new width of the bounding box
+
+        The bounding box is scaled about (x, y) with a single transformation.
         """
-        current_x = self.x
-        current_y = self.y
-        self.scale *= value / self.width
-        self.x = current_x
-        self.y = current_y
+        _scale_about_xy(self, value / self.width)
 
     @property
     def height(self) -> float:
@@ -498,4 +682,4 @@ class HasBoundingBox(SupportsBounds):
 
         :param value: the new height of the bounding box
         """
-        self.width *= value / self.height
+        _scale_about_xy(self, value / self.height)
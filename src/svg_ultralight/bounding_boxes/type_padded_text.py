@@ -67,7 +67,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from svg_ultralight.bounding_boxes.supports_bounds import SupportsBounds
-from svg_ultralight.bounding_boxes.type_bounding_box import BoundingBox
+from svg_ultralight.bounding_boxes.type_bounding_box import (
+    BoundingBox,
+    DeferredElement,
+)
+from svg_ultralight.transformations import IDENTITY_MATRIX, format_matrix
 
 if TYPE_CHECKING:
     from lxml.etree import _Element as EtreeElement  # type: ignore
@@ -75,9 +79,22 @@ if TYPE_CHECKING:
 _Matrix = tuple[float, float, float, float, float, float]
 
 
-class PaddedText(SupportsBounds):
+class PaddedText(DeferredElement, SupportsBounds):
     """A line of text with a bounding box and padding."""
 
+    __slots__ = (
+        "_defer_depth",
+        "_elem",
+        "_padded_bbox_args",
+        "_padded_bbox_key",
+        "_pending_tmat",
+        "base_bpad",
+        "base_tpad",
+        "bbox",
+        "lpad",
+        "rpad",
+    )
+
     def __init__(
         self,
         elem: EtreeElement,
@@ -96,12 +113,14 @@ class PaddedText(SupportsBounds):
         :param bpad: Bottom padding.
         :param lpad: Left padding.
         """
-        self.elem = elem
+        DeferredElement.__init__(self, elem)
         self.bbox = bbox
         self.base_tpad = tpad
         self.rpad = rpad
         self.base_bpad = bpad
         self.lpad = lpad
+        self._padded_bbox_key: tuple[object, ...] = ()
+        self._padded_bbox_args = (0.0, 0.0, 0.0, 0.0)
 
     @property
     def padded_bbox(self) -> BoundingBox:
@@ -113,10 +132,29 @@ class PaddedText(SupportsBounds):
         `svg_ultralight.BoundingBox.merged`. The merged bbox and merged_bbox
         attributes of multiple bounding boxes can be used to create a PaddedText
         instance around multiple text elements (a <g> elem).
-        """
-        return BoundingBox(
-            self.lmargin, self.capline, self.padded_width, self.padded_height
+
+        The padded dimensions are cached until the bbox, its transformation, or
+        any padding value changes. A new BoundingBox is returned each time, so the
+        result can be transformed without altering this instance.
+        """
+        bbox = self.bbox
+        key = (
+            bbox,
+            bbox.transformation,
+            self.base_tpad,
+            self.rpad,
+            self.base_bpad,
+            self.lpad,
         )
+        if key != self._padded_bbox_key:
+            self._padded_bbox_key = key
+            self._padded_bbox_args = (
+                self.lmargin,
+                self.capline,
+                self.padded_width,
+                self.padded_height,
+            )
+        return BoundingBox(*self._padded_bbox_args)
 
     @property
     def transformation(self) -> _Matrix:
@@ -124,7 +162,24 @@ class PaddedText(SupportsBounds):
         return self.bbox.transformation
 
     def _update_elem(self):
-        self.elem.attrib["transform"] = self.bbox.transform_string
+        self._apply_or_defer(self.bbox.transformation)
+
+    def _defer_transformation(self, tmat: _Matrix) -> None:
+        """Keep only the latest bbox transformation.
+
+        :param tmat: the full transformation of self.bbox
+        """
+        self._pending_tmat = tmat
+
+    def _apply_transformation(self, tmat: _Matrix) -> None:
+        """Write the bbox transformation to the element.
+
+        :param tmat: the full transformation of self.bbox
+
+        Unlike BoundElement, PaddedText overwrites the element transform with the
+        transformation of its bbox.
+        """
+        self._elem.set("transform", format_matrix(tmat))
 
     def transform(
         self,
@@ -140,10 +195,97 @@ class PaddedText(SupportsBounds):
         :param scale: a scaling factor
         :param dx: the x translation
         :param dy: the y translation
+
+        An identity transformation returns without touching bbox or elem.
         """
+        if (
+            (transformation is None or transformation == IDENTITY_MATRIX)
+            and scale in {None, 1}
+            and not dx
+            and not dy
+        ):
+            return
         self.bbox.transform(transformation, scale=scale, dx=dx, dy=dy)
         self._update_elem()
 
+    def _scale_preserving_baseline(
+        self, scale: float, dx: float = 0, dy: float = 0
+    ) -> None:
+        """Scale the text element about its left edge and baseline, then translate.
+
+        :param scale: the scale factor
+        :param dx: optional x translation applied after scaling
+        :param dy: optional y translation applied after scaling
+        :effects: transforms bbox and updates elem once
+
+        This is equivalent to scaling the bbox then translating it back to the
+        original x and baseline, but builds a single transformation matrix.
+        """
+        if scale == 1:
+            self.transform(dx=dx, dy=dy)
+            return
+        bbox = self.bbox
+        x = bbox.x
+        baseline = bbox.y2 + self.base_bpad * bbox.scale
+        tx = x - x * scale + dx
+        ty = baseline - baseline * scale + dy
+        self.transform((scale, 0, 0, scale, tx, ty))
+
+    def set_bounds(
+        self,
+        *,
+        lmargin: float | None = None,
+        rmargin: float | None = None,
+        capline: float | None = None,
+        baseline: float | None = None,
+        width: float | None = None,
+        height: float | None = None,
+    ) -> None:
+        """Scale and move this line of text with a single transformation.
+
+        :param lmargin: optional new left margin
+        :param rmargin: optional new right margin
+        :param capline: optional new capline
+        :param baseline: optional new baseline
+        :param width: optional new padded width
+        :param height: optional new padded height
+        :raises ValueError: if both width and height are given, or if more than one
+            bound is given on either axis
+        :effects: transforms bbox and updates elem once
+
+        Equivalent to setting padded_width (or padded_height), then one margin, then
+        capline or baseline, but the combined transformation is applied with one
+        call to `transform`. Prefer this to setting each attribute in turn when
+        laying out many lines of text.
+        """
+        if width is not None and height is not None:
+            msg = "Cannot set both width and height. PaddedText scaling is uniform."
+            raise ValueError(msg)
+        if lmargin is not None and rmargin is not None:
+            msg = "Cannot set both lmargin and rmargin. Set one margin and width."
+            raise ValueError(msg)
+        if capline is not None and baseline is not None:
+            msg = "Cannot set both capline and baseline. Set one line and height."
+            raise ValueError(msg)
+        if height is not None:
+            width = self.padded_width * (height / self.padded_height)
+        bbox = self.bbox
+        scale = 1
+        if width is not None:
+            scale = (width - self.lpad - self.rpad) / bbox.width
+        dx = 0
+        if lmargin is not None:
+            dx = lmargin - self.lmargin
+        elif rmargin is not None:
+            dx = rmargin - (bbox.x + bbox.width * scale + self.rpad)
+        dy = 0
+        if capline is not None:
+            current_baseline = self.baseline
+            dy = capline - current_baseline - (self.capline - current_baseline) * scale
+        elif baseline is not None:
+            dy = baseline - self.baseline
+        self._scale_preserving_baseline(scale, dx, dy)
+
     @property
     def tpad(self) -> float:
         """The top padding of this line of text.
@@ -177,15 +319,15 @@ class PaddedText(SupportsBounds):
         self.base_bpad = value / self.bbox.scale
 
     @property
-    def lmargin(self) -> float:
+    def x(self) -> float:
         """The left margin of this line of text.
 
         :return: The left margin of this line of text.
         """
         return self.bbox.x - self.lpad
 
-    @lmargin.setter
-    def lmargin(self, value: float) -> None:
+    @x.setter
+    def x(self, value: float) -> None:
         """Set the left margin of this line of text.
 
         :param value: The left margin of this line of text.
@@ -193,15 +335,15 @@ class PaddedText(SupportsBounds):
         self.transform(dx=value + self.lpad - self.bbox.x)
 
     @property
-    def rmargin(self) -> float:
+    def x2(self) -> float:
         """The right margin of this line of text.
 
         :return: The right margin of this line of text.
         """
         return self.bbox.x2 + self.rpad
 
-    @rmargin.setter
-    def rmargin(self, value: float) -> None:
+    @x2.setter
+    def x2(self, value: float) -> None:
         """Set the right margin of this line of text.
 
         :param value: The right margin of this line of text.
@@ -209,15 +351,16 @@ class PaddedText(SupportsBounds):
         self.transform(dx=value - self.rpad - self.bbox.x2)
 
     @property
-    def capline(self) -> float:
+    def y(self) -> float:
         """The top of this line of text.
 
         :return: The top of this line of text.
         """
-        return self.bbox.y - self.tpad
+        bbox = self.bbox
+        return bbox.y - self.base_tpad * bbox.scale
 
-    @capline.setter
-    def capline(self, value: float) -> None:
+    @y.setter
+    def y(self, value: float) -> None:
         """Set the top of this line of text.
 
         :param value: The top of this line of text.
@@ -225,139 +368,33 @@ class PaddedText(SupportsBounds):
         self.transform(dy=value + self.tpad - self.bbox.y)
 
     @property
-    def baseline(self) -> float:
+    def y2(self) -> float:
         """The bottom of this line of text.
 
         :return: The bottom of this line of text.
         """
-        return self.bbox.y2 + self.bpad
+        bbox = self.bbox
+        return bbox.y2 + self.base_bpad * bbox.scale
 
-    @baseline.setter
-    def baseline(self, value: float) -> None:
+    @y2.setter
+    def y2(self, value: float) -> None:
         """Set the bottom of this line of text.
 
         :param value: The bottom of this line of text.
         """
         self.transform(dy=value - self.bpad - self.bbox.y2)
 
-    @property
-    def padded_width(self) -> float:
-        """The width of this line of text with padding.
-
-        :return: The scaled width of this line of text with padding.
-        """
-        return self.bbox.width + self.lpad + self.rpad
-
-    @padded_width.setter
-    def padded_width(self, width: float) -> None:
-        """Scale to padded_width = width without scaling padding.
-
-        :param width: The new width of this line of text.
-        :effects: the text_element bounding box is scaled to width - lpad - rpad.
-
-        Svg_Ultralight BoundingBoxes preserve x and y when scaling. This is
-        consistent with how rectangles, viewboxes, and anything else defined by x, y,
-        width, height behaves in SVG. This is unintuitive for text, because the
-        baseline is near y2 (y + height) not y. So, we preserve baseline (alter y
-        *and* y2) when scaling.
-        """
-        baseline = self.baseline
-        self.bbox.width = width - self.lpad - self.rpad
-        self.baseline = baseline
-        self._update_elem()
-
-    @property
-    def padded_height(self) -> float:
-        """The height of this line of text with padding.
-
-        :return: The scaled height of this line of text with padding.
-        """
-        return self.bbox.height + self.tpad + self.bpad
-
-    @padded_height.setter
-    def padded_height(self, height: float) -> None:
-        """Scale to padded_height = height without scaling padding.
-
-        :param height: The new height of this line of text.
-        :effects: the text_element bounding box is scaled to height - tpad - bpad.
-        """
-        self.padded_width *= height / self.padded_height
-
-    @property
-    def x(self) -> float:
-        """The left margin of this line of text.
-
-        :return: The left margin of this line of text.
-        """
-        return self.lmargin
-
-    @x.setter
-    def x(self, value: float) -> None:
-        """Set the left margin of this line of text.
-
-        :param value: The new left margin of this line of text.
-        """
-        self.lmargin = value
-
-    @property
-    def x2(self) -> float:
-        """The right margin of this line of text.
-
-        :return: The right margin of this line of text.
-        """
-        return self.rmargin
-
-    @x2.setter
-    def x2(self, value: float) -> None:
-        """Set the right margin of this line of text.
-
-        :param value: The new right margin of this line of this text.
-        """
-        self.rmargin = value
-
-    @property
-    def y(self) -> float:
-        """The capline of this line of text.
-
-        :return: The capline of this line of text.
-        """
-        return self.capline
-
-    @y.setter
-    def y(self, value: float) -> None:
-        """Set the capline of this line of text.
-
-        :param value: The new capline of this line of text.
-        """
-        self.capline = value
-
-    @property
-    def y2(self) -> float:
-        """The baseline of this line of text.
-
-        :return: The baseline of this line of text.
-        """
-        return self.baseline
-
-    @y2.setter
-    def y2(self, value: float) -> None:
-        """Set the baseline of this line of text.
-
-        :param value: The new baseline of this line of text.
-        """
-        self.baseline = value
-
     @property
     def width(self) -> float:
         """The width of this line of text with padding.
 
         :return: The scaled width of this line of text with padding.
         """
-        return self.padded_width
+        return self.bbox.width + self.lpad + self.rpad
 
     @width.setter
     def width(self, value: float) -> None:
-        """Scale to width without scaling padding.
+        """Scale to padded_width = value without scaling padding.
 
         :param value: The new width of this line of text.
         :effects: the text_element bounding box is scaled to width - lpad - rpad.
@@ -368,9 +405,12 @@ class PaddedText(SupportsBounds):
         baseline is near y2 (y + height) not y. So, we preserve baseline (alter y
         *and* y2) when scaling.
         """
-        baseline = self.baseline
-        self.padded_width = value
-        self.baseline = baseline
+        lpad = self.lpad
+        rpad = self.rpad
+        bbox_width = self.bbox.width
+        if value == bbox_width + lpad + rpad:
+            return
+        self._scale_preserving_baseline((value - lpad - rpad) / bbox_width)
 
     @property
     def height(self) -> float:
@@ -378,16 +418,30 @@ class PaddedText(SupportsBounds):
 
         :return: The scaled height of this line of text with padding.
         """
-        return self.padded_height
+        bbox = self.bbox
+        scale = bbox.scale
+        return bbox.height + self.base_tpad * scale + self.base_bpad * scale
 
     @height.setter
     def height(self, value: float) -> None:
-        """Scale to height without scaling padding.
+        """Scale to padded_height = value without scaling padding.
 
         :param value: The new height of this line of text.
         :effects: the text_element bounding box is scaled to height - tpad - bpad.
         """
-        self.padded_height = value
+        padded_height = self.height
+        if value == padded_height:
+            return
+        self.width *= value / padded_height
+
+    # Names for the padded bounds that read like the text they describe. These are
+    # the same property objects as the SupportsBounds names above.
+    lmargin = x
+    rmargin = x2
+    capline = y
+    baseline = y2
+    padded_width = width
+    padded_height = height
 
     @property
     def cx(self) -> float:
@@ -395,7 +449,9 @@ class PaddedText(SupportsBounds):
 
         :return: the x coordinate of the center between margins
         """
-        return self.lmargin + self.padded_width / 2
+        bbox = self.bbox
+        lpad = self.lpad
+        return bbox.x - lpad + (bbox.width + lpad + self.rpad) / 2
 
     @cx.setter
     def cx(self, value: float):
@@ -403,7 +459,10 @@ class PaddedText(SupportsBounds):
 
         :param value: the new x coordinate of the center between margins
         """
-        self.lmargin = value - self.padded_width / 2
+        bbox = self.bbox
+        lpad = self.lpad
+        padded_width = bbox.width + lpad + self.rpad
+        self.transform(dx=value - padded_width / 2 + lpad - bbox.x)
 
     @property
     def cy(self) -> float:
@@ -411,7 +470,10 @@ class PaddedText(SupportsBounds):
 
         :return: the y coordinate of the center between baseline and capline
         """
-        return self.capline + self.padded_height / 2
+        bbox = self.bbox
+        scale = bbox.scale
+        tpad = self.base_tpad * scale
+        return bbox.y - tpad + (bbox.height + tpad + self.base_bpad * scale) / 2
 
     @cy.setter
     def cy(self, value: float):
@@ -419,7 +481,11 @@ class PaddedText(SupportsBounds):
 
         :param value: the new y coordinate of the center between baseline and capline
         """
-        self.capline = value - self.padded_height / 2
+        bbox = self.bbox
+        scale = bbox.scale
+        tpad = self.base_tpad * scale
+        padded_height = bbox.height + tpad + self.base_bpad * scale
+        self.transform(dy=value - padded_height / 2 + tpad - bbox.y)
 
     @property
     def scale(self) -> float:
@@ -54,8 +54,12 @@ def new_element(tag: str | QName, **attributes: str | float) -> EtreeElement:
         b'<text>please star my project</text>'
 
     """
+    text = attributes.pop("text", None)
     elem = etree.Element(tag)
-    set_attributes(elem, **attributes)
+    if text is not None:
+        elem.text = str(text)
+    if attributes:
+        set_attributes(elem, **attributes)
     return elem
 
 
@@ -74,8 +78,12 @@ def new_sub_element(
         >>> etree.tostring(parent)
         b'<g><rect/></g>'
     """
+    text = attributes.pop("text", None)
     elem = etree.SubElement(parent, tag)
-    set_attributes(elem, **attributes)
+    if text is not None:
+        elem.text = str(text)
+    if attributes:
+        set_attributes(elem, **attributes)
     return elem
 
 
@@ -104,8 +112,9 @@ def deepcopy_element(elem: EtreeElement, **attributes: str | float) -> EtreeElem
         "deepcopy_element is deprecated. "
         + "Use copy.deepcopy from the standard library instead.",
         category=DeprecationWarning,
-        stacklevel=1,
+        stacklevel=2,
     )
     elem = copy.deepcopy(elem)
-    _ = update_element(elem, **attributes)
+    if attributes:
+        set_attributes(elem, **attributes)
     return elem
@@ -11,17 +11,15 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from paragraphs import par
-
 try:
     from PIL import Image
 
     if TYPE_CHECKING:
         from PIL.Image import Image as ImageType
 except ImportError as err:
-    msg = par(
-        """PIL is not installed. Install it using 'pip install Pillow' to use
-        svg_ultralight.image_ops module."""
+    msg = (
+        "PIL is not installed. Install it using 'pip install Pillow' to use "
+        + "svg_ultralight.image_ops module."
     )
     raise ImportError(msg) from err
 
@@ -10,6 +10,7 @@ Rounding some numbers to ensure quality svg rendering:
 
 from __future__ import annotations
 
+import functools
 import re
 from contextlib import suppress
 from enum import Enum
@@ -96,6 +97,25 @@ def format_numbers_in_string(data: float | str) -> str:
     return "".join(words)
 
 
+@functools.lru_cache(maxsize=1024)
+def _fix_key(key: str) -> str:
+    """Convert a Python keyword argument name to an svg attribute name.
+
+    :param key: element attribute name as passed to new_element, etc.
+    :return: svg attribute name
+
+    * replace '_' with '-'
+    * remove trailing '_'
+    * convert `namespace:tag` to a qualified name
+
+    Documents reuse a small set of attribute names, so the results are cached.
+    """
+    if ":" in key:
+        namespace, tag = key.split(":")
+        return str(etree.QName(NSMAP[namespace], tag))
+    return key.rstrip("_").replace("_", "-")
+
+
 def _fix_key_and_format_val(key: str, val: str | float) -> tuple[str, str]:
     """Format one key, value pair for an svg element.
 
@@ -120,12 +140,7 @@ def _fix_key_and_format_val(key: str, val: str | float) -> tuple[str, str]:
     popular one will be 'class') can be passed with a trailing underscore (e.g.,
     class_='body_text').
     """
-    if ":" in key:
-        namespace, tag = key.split(":")
-        key_ = str(etree.QName(NSMAP[namespace], tag))
-    else:
-        key_ = key.rstrip("_").replace("_", "-")
-
+    key_ = _fix_key(key)
     if key_ in {"id", "text"}:
         return key_, str(val)
 
@@ -150,9 +165,8 @@ def set_attributes(elem: EtreeElement, **attributes: str | float) -> None:
     """
     attr_dict = format_attr_dict(**attributes)
 
-    dots = {"text"}
-    for dot in dots & set(attr_dict):
-        setattr(elem, dot, attr_dict.pop(dot))
+    if "text" in attr_dict:
+        elem.text = attr_dict.pop("text")
 
     for key, val in attr_dict.items():
         elem.set(key, val)
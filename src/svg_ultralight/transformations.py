@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from contextlib import suppress
 from typing import TYPE_CHECKING, cast
@@ -20,6 +21,8 @@ _RE_MATRIX = re.compile(r"matrix\(([^)]+)\)")
 
 _Matrix = tuple[float, float, float, float, float, float]
 
+IDENTITY_MATRIX: _Matrix = (1, 0, 0, 1, 0, 0)
+
 
 def mat_dot(mat1: _Matrix, mat2: _Matrix) -> _Matrix:
     """Matrix multiplication for svg-style matrices.
@@ -41,12 +44,14 @@ def mat_dot(mat1: _Matrix, mat2: _Matrix) -> _Matrix:
     the only scaling implemented in my BoundingBox classes. However, all six values
     are implemented in case this function is used in other contexts.
     """
-    aa = sum(mat1[x] * mat2[y] for x, y in ((0, 0), (2, 1)))
-    bb = sum(mat1[x] * mat2[y] for x, y in ((1, 0), (3, 1)))
-    cc = sum(mat1[x] * mat2[y] for x, y in ((0, 2), (2, 3)))
-    dd = sum(mat1[x] * mat2[y] for x, y in ((1, 2), (3, 3)))
-    ee = sum(mat1[x] * mat2[y] for x, y in ((0, 4), (2, 5))) + mat1[4]
-    ff = sum(mat1[x] * mat2[y] for x, y in ((1, 4), (3, 5))) + mat1[5]
+    a1, b1, c1, d1, e1, f1 = mat1
+    a2, b2, c2, d2, e2, f2 = mat2
+    aa = a1 * a2 + c1 * b2
+    bb = b1 * a2 + d1 * b2
+    cc = a1 * c2 + c1 * d2
+    dd = b1 * c2 + d1 * d2
+    ee = a1 * e2 + c1 * f2 + e1
+    ff = b1 * e2 + d1 * f2 + f1
     return (aa, bb, cc, dd, ee, ff)
 
 
@@ -81,9 +86,9 @@ def get_transform_matrix(elem: EtreeElement) -> _Matrix:
 
     :param element: svg element
     """
-    transform = elem.attrib.get("transform")
+    transform = elem.get("transform")
     if not transform:
-        return (1, 0, 0, 1, 0, 0)
+        return IDENTITY_MATRIX
     values_str = ""
     with suppress(AttributeError):
         values_str = cast(re.Match[str], _RE_MATRIX.match(transform)).group(1)
@@ -105,21 +110,50 @@ def new_transformation_matrix(
 
     This takes the standard arguments in the BoundingBox classes and returns an
     svg-style transformation matrix.
+
+    Most calls pass either a matrix or some of scale, dx, and dy, so those cases
+    return without a matrix product.
     """
-    transformation = transformation or (1, 0, 0, 1, 0, 0)
     scale = scale or 1
     dx = dx or 0
     dy = dy or 0
+    if not transformation:
+        return (scale, 0, 0, scale, dx, dy)
+    if scale == 1 and dx == 0 and dy == 0:
+        return transformation
     return mat_dot((scale, 0, 0, scale, dx, dy), transformation)
 
 
+@functools.lru_cache(maxsize=4096)
+def format_matrix(matrix: _Matrix) -> str:
+    """Format an svg-style transformation matrix as a transform attribute value.
+
+    :param matrix: transformation matrix
+    :return: "matrix(a b c d e f)" with each value formatted by format_number
+
+    Elements aligned or stacked together will often share a transformation, so
+    formatted strings are cached.
+    """
+    return f"matrix({' '.join(map(format_number, matrix))})"
+
+
 def transform_element(elem: EtreeElement, matrix: _Matrix) -> EtreeElement:
     """Apply a transformation matrix to an svg element.
 
     :param elem: svg element
     :param matrix: transformation matrix
+
+    A pure translation (the common case when aligning elements) only shifts the
+    last two values of the current matrix, so it skips the matrix product. An
+    identity matrix leaves the element untouched.
     """
+    if matrix == IDENTITY_MATRIX:
+        return elem
     current = get_transform_matrix(elem)
-    updated = map(format_number, mat_dot(matrix, current))
-    elem.attrib["transform"] = f"matrix({' '.join(updated)})"
+    if matrix[:4] == (1, 0, 0, 1):
+        aa, bb, cc, dd, ee, ff = current
+        updated = (aa, bb, cc, dd, ee + matrix[4], ff + matrix[5])
+    else:
+        updated = mat_dot(matrix, current)
+    elem.set("transform", format_matrix(updated))
     return elem
@@ -93,6 +93,27 @@ class TestBoundElement:
         assert bound_element.height == 250.0
         assert bound_element.y2 == 250.0
 
+    def test_unit_scale_skips_elem(self, bound_element: BoundElement):
+        bound_element.width = bound_element.width
+        bound_element.height = bound_element.height
+        bound_element.scale = bound_element.scale
+        bound_element.x = bound_element.x
+        bound_element.transform((1, 0, 0, 1, 0, 0))
+        assert "transform" not in bound_element.elem.attrib
+
+    def test_deferred_elem_updates(self, bound_element: BoundElement):
+        expect = copy.deepcopy(bound_element)
+        expect.width = 60
+        expect.x = 3
+        expect.y2 = 5
+        elem = bound_element.elem
+        with bound_element:
+            bound_element.width = 60
+            bound_element.x = 3
+            bound_element.y2 = 5
+            assert "transform" not in elem.attrib
+        assert elem.attrib["transform"] == expect.elem.attrib["transform"]
+
 
 class TestPaddedText:
     @pytest.fixture
@@ -152,6 +173,15 @@ class TestPaddedText:
         assert bound_element.y2 == 250.0
         assert bound_element.cy == 148.0
 
+    def test_cx_cy(self, bound_element: PaddedText):
+        bound_element.scale = 2
+        bound_element.cx = 10
+        bound_element.cy = -10
+        assert bound_element.cx == 10
+        assert bound_element.cy == -10
+        assert bound_element.width == 206
+        assert bound_element.height == 408
+
     def test_width(self, bound_element: BoundElement):
         assert bound_element.width == 106.0
         bound_element.width = 150.0
@@ -164,6 +194,107 @@ class TestPaddedText:
         assert math.isclose(bound_element.height, 252.76)
         assert bound_element.y2 == 203.0
 
+    def test_padded_width_preserves_lmargin_and_baseline(
+        self, bound_element: PaddedText
+    ):
+        bound_element.transform(scale=3, dx=7, dy=-2)
+        lmargin = bound_element.lmargin
+        baseline = bound_element.baseline
+        bound_element.padded_width = 50
+        assert math.isclose(bound_element.padded_width, 50)
+        assert math.isclose(bound_element.lmargin, lmargin)
+        assert math.isclose(bound_element.baseline, baseline)
+        transform = bound_element.elem.attrib["transform"]
+        assert transform == bound_element.bbox.transform_string
+
+    def test_padded_bbox(self, bound_element: PaddedText):
+        assert bbox_dict(bound_element.padded_bbox) == {
+            "x": -4,
+            "y": -1,
+            "width": 106,
+            "height": 204,
+        }
+        bound_element.padded_bbox.x = 100
+        assert bound_element.padded_bbox.x == -4
+        bound_element.x = 10
+        assert bound_element.padded_bbox.x == 10
+        bound_element.lpad = 0
+        assert bound_element.padded_bbox.x == 14
+        assert bound_element.padded_bbox.width == 102
+        bound_element.bbox.scale = 2
+        assert bound_element.padded_bbox.height == 408
+
+    def test_set_bounds(self, bound_element: PaddedText):
+        expect = copy.deepcopy(bound_element)
+        expect.padded_width = 60
+        expect.lmargin = 3
+        expect.capline = -8
+        bound_element.set_bounds(lmargin=3, capline=-8, width=60)
+        for attr in ("x", "y", "x2", "y2", "width", "height"):
+            assert math.isclose(getattr(bound_element, attr), getattr(expect, attr))
+
+    def test_set_bounds_rmargin_baseline(self, bound_element: PaddedText):
+        expect = copy.deepcopy(bound_element)
+        expect.padded_width = 60
+        expect.rmargin = 3
+        expect.baseline = -8
+        bound_element.set_bounds(rmargin=3, baseline=-8, width=60)
+        for attr in ("x", "y", "x2", "y2", "width", "height"):
+            assert math.isclose(getattr(bound_element, attr), getattr(expect, attr))
+
+    def test_set_bounds_conflicting_bounds(self, bound_element: PaddedText):
+        with pytest.raises(ValueError):
+            bound_element.set_bounds(lmargin=1, rmargin=2)
+        with pytest.raises(ValueError):
+            bound_element.set_bounds(capline=1, baseline=2)
+
+    def test_set_bounds_height(self, bound_element: PaddedText):
+        expect = copy.deepcopy(bound_element)
+        expect.padded_height = 60
+        bound_element.set_bounds(height=60)
+        assert bbox_dict(bound_element) == pytest.approx(bbox_dict(expect))
+
+    def test_set_bounds_width_and_height(self, bound_element: PaddedText):
+        with pytest.raises(ValueError):
+            bound_element.set_bounds(width=1, height=1)
+
+    def test_deferred_elem_updates(self, bound_element: PaddedText):
+        elem = bound_element.elem
+        with bound_element:
+            bound_element.padded_width = 60
+            bound_element.x = 3
+            assert "transform" not in elem.attrib
+            assert bound_element.x == 3
+        transform = elem.attrib["transform"]
+        assert transform == bound_element.bbox.transform_string
+
+    def test_identity_transform_skips_elem(self, bound_element: PaddedText):
+        bound_element.transform()
+        bound_element.transform((1, 0, 0, 1, 0, 0), scale=1, dx=0)
+        assert "transform" not in bound_element.elem.attrib
+        bound_element.transform(scale=1, dy=2)
+        assert "transform" in bound_element.elem.attrib
+
+    def test_deferred_elem_flushed_on_read(self, bound_element: PaddedText):
+        with bound_element:
+            bound_element.x = 3
+            transform = bound_element.elem.attrib["transform"]
+            assert transform == bound_element.bbox.transform_string
+            bound_element.y = 4
+        transform = bound_element.elem.attrib["transform"]
+        assert transform == bound_element.bbox.transform_string
+
+    def test_no_op_setters_skip_elem(self, bound_element: PaddedText):
+        bound_element.padded_width = bound_element.padded_width
+        bound_element.padded_height = bound_element.padded_height
+        bound_element.lmargin = bound_element.lmargin
+        bound_element.baseline = bound_element.baseline
+        bound_element.cx = bound_element.cx
+        bound_element.set_bounds(lmargin=bound_element.lmargin)
+        assert "transform" not in bound_element.elem.attrib
+        bound_element.cy += 1
+        assert "transform" in bound_element.elem.attrib
+
 
 class TestBoundCollection:
 
@@ -189,6 +320,45 @@ class TestBoundCollection:
         elem_trans = elem.attrib["transform"]
         assert blem_trans == elem_trans
 
+    def test_deferred_transforms(self):
+        def new_collection() -> tuple[BoundCollection, etree._Element]:
+            rect = new_element("rect", x=0, y=0, width=100, height=200)
+            blem = BoundElement(rect, BoundingBox(0, 0, 100, 200))
+            elem = copy.deepcopy(rect)
+            return BoundCollection(blem, elem), elem
+
+        expect, expect_elem = new_collection()
+        expect.x = -4
+        expect.width = 60
+        bound_collection, elem = new_collection()
+        with bound_collection:
+            bound_collection.x = -4
+            bound_collection.width = 60
+            assert "transform" not in elem.attrib
+        assert bound_collection.bbox == expect.bbox
+        assert elem.attrib["transform"] == expect_elem.attrib["transform"]
+
+    def test_deferred_members_update(self):
+        def new_collection() -> tuple[BoundCollection, PaddedText]:
+            elem = new_element("rect", x=0, y=0, width=100, height=200)
+            blem = PaddedText(elem, BoundingBox(0, 0, 100, 200), 1, 2, 3, 4)
+            return BoundCollection(blem, copy.deepcopy(elem)), blem
+
+        expect, expect_blem = new_collection()
+        expect.x = 50
+        expect.width = 50
+        expect_blem.x = 7
+        bound_collection, blem = new_collection()
+        with bound_collection:
+            bound_collection.x = 50
+            assert blem.x == 50
+            bound_collection.width = 50
+            blem.x = 7
+            assert "transform" not in blem._elem.attrib  # type: ignore
+        assert blem.x == 7
+        assert blem.bbox == expect_blem.bbox
+        assert blem.elem.attrib["transform"] == expect_blem.elem.attrib["transform"]
+
 
 class TestBoundHelpers:
     def test_pad_bbox(self):
@@ -239,6 +409,28 @@ class TestBoundHelpers:
         assert cut.width == 3
         assert cut.height == 4
 
+    def test_merged_single(self):
+        bbox = BoundingBox(0, 1, 2, 3)
+        bbox.transform(scale=2, dx=1)
+        merged = BoundingBox.merged(bbox)
+        assert merged is not bbox
+        assert merged.transformation == (1, 0, 0, 1, 0, 0)
+        assert bbox_dict(merged) == {"x": 1, "y": 2, "width": 4, "height": 6}
+
+    def test_translate_matches_matrix_product(self):
+        translated = BoundingBox(0, 1, 2, 3)
+        transformed = BoundingBox(0, 1, 2, 3)
+        for bbox in (translated, transformed):
+            bbox.transform(scale=1.5, dx=2, dy=-3)
+        translated.transform(dx=0.25, dy=7)
+        transformed.transform((1, 0, 0, 1, 0.25, 7))
+        assert translated.transformation == transformed.transformation
+
+    def test_list_transformation(self):
+        bbox = BoundingBox(0, 0, 1, 1, [2, 0, 0, 2, 1, 0])  # type: ignore
+        assert bbox.transformation == (2, 0, 0, 2, 1, 0)
+        assert bbox.transform_string == "matrix(2 0 0 2 1 0)"
+
     def test_bbox_dict(self):
         bbox = BoundingBox(0, 1, 2, 3)
         assert bbox_dict(bbox) == {"x": 0, "y": 1, "width": 2, "height": 3}
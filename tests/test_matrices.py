@@ -4,7 +4,15 @@
 :created: 2024-05-05
 """
 
-from svg_ultralight.transformations import mat_dot, mat_apply, mat_invert
+from svg_ultralight.transformations import (
+    format_matrix,
+    mat_dot,
+    mat_apply,
+    mat_invert,
+    new_transformation_matrix,
+    transform_element,
+)
+from svg_ultralight.constructors import new_element
 import random
 import math
 from contextlib import suppress
@@ -34,3 +42,25 @@ class TestMat:
                 result = mat_dot(tmat, mat_invert(tmat))
                 for x, y in zip(result, identity):
                     assert math.isclose(x, y, abs_tol=0.0001)
+
+    def test_format_matrix(self):
+        assert format_matrix((1, 0, 0, 1, 0.5, -0.0)) == "matrix(1 0 0 1 0.5 0)"
+        assert format_matrix((1.0, 0.0, 0.0, 1.0, 0.5, 0.0)) == "matrix(1 0 0 1 0.5 0)"
+
+    def test_new_transformation_matrix(self):
+        tmat = (1, 2, 3, 4, 5, 6)
+        assert new_transformation_matrix() == (1, 0, 0, 1, 0, 0)
+        assert new_transformation_matrix(scale=2, dy=3) == (2, 0, 0, 2, 0, 3)
+        assert new_transformation_matrix(tmat) == tmat
+        expect = mat_dot((2, 0, 0, 2, 1, 0), tmat)
+        assert new_transformation_matrix(tmat, scale=2, dx=1) == expect
+
+    def test_transform_element_translation(self):
+        elem = new_element("rect", transform="matrix(2 0 0 2 1 1)")
+        _ = transform_element(elem, (1, 0, 0, 1, 3, -4))
+        assert elem.attrib["transform"] == "matrix(2 0 0 2 4 -3)"
+
+    def test_transform_element_identity(self):
+        elem = new_element("rect")
+        _ = transform_element(elem, (1, 0, 0, 1, 0, 0))
+        assert "transform" not in elem.attrib
@@ -4,6 +4,7 @@
 :created: 1/31/2020
 """
 
+import pytest
 from lxml import etree
 
 from svg_ultralight import constructors
@@ -58,3 +59,13 @@ class TestUpdateElement:
         elem = constructors.new_element("line", x=10, y1=80)
         _ = constructors.update_element(elem, stroke_width=2)
         assert etree.tostring(elem) == b'<line x="10" y1="80" stroke-width="2"/>'
+
+
+class TestDeepcopyElement:
+    def test_warns_every_call(self) -> None:
+        """Each call raises a DeprecationWarning."""
+        elem = constructors.new_element("line", x=10)
+        for _ in range(2):
+            with pytest.warns(DeprecationWarning):
+                copied = constructors.deepcopy_element(elem, y1=80)
+            assert etree.tostring(copied) == b'<line x="10" y1="80"/>'